@@ -0,0 +1,40 @@
+"""Store admin_managers.email as VARCHAR
+
+Revision ID: 6435b133af67
+Revises: 0ff83ec443e9
+Create Date: 2026-10-16 10:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6435b133af67'
+down_revision: Union[str, None] = '0ff83ec443e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "admin_managers",
+        "email",
+        existing_type=sa.CHAR(255),
+        type_=sa.String(255),
+        existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "admin_managers",
+        "email",
+        existing_type=sa.String(255),
+        type_=sa.CHAR(255),
+        existing_nullable=False
+    )
@@ -5,9 +5,6 @@ from ..schemas.auth import UserSignUp, UserSignIn, Token
 from ..services.auth_service import AuthService
 from ..repositories.user_repository import UserRepository
 from ..database import get_async_session
-from ..schemas.user import UserResponse
-from ..models.user import User
-from ..dependencies.auth_dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -1,7 +1,7 @@
 # defines FastAPI routes for users operations; thin controllers delegate to 'UserService'.
 
-from fastapi import APIRouter, Depends, Request, HTTPException
-from fastapi.responses import JSONResponse
+import logging
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 from uuid import UUID
 from ..schemas.user import UserCreate, UserResponse, UserUpdate
@@ -12,6 +12,8 @@ from ..database import get_async_session
 from ..dependencies.auth_dependencies import get_current_user
 from ..models.user import User
 
+logger = logging.getLogger(__name__)
+
 #dependency injection functions
 async def get_user_repository(session=Depends(get_async_session)) -> IUserRepository:
     return UserRepository(session)
@@ -87,10 +89,9 @@ async def update_user_details(
     except PermissionError as exc:
         # Specific error for authorization failure
         raise HTTPException(status_code=403, detail=str(exc))
-    except Exception as exc:
+    except Exception:
         # Catch-all for other unexpected errors
-        # Log this exception for debugging
-        # logger.error(f"Unexpected error updating user {user_id_to_update}: {exc}")
+        logger.exception("Unexpected error updating user %s", user_id_to_update)
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
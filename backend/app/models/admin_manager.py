@@ -21,7 +21,7 @@ class AdminManager(Base, TimestampMixing):
     )
 
     email = Column(
-        CHAR(255),
+        String(255),
         nullable=False,
         unique=True
     )
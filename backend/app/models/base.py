@@ -21,6 +21,10 @@ Base = declarative_base(metadata=metadata, cls=AsyncAttrs)
 
 class TimestampMixing:
     """Add created_at and updated_at columns with automatic timestamps."""
+    # Repositories refresh explicitly after commit, so don't fetch server-generated
+    # timestamps back after every INSERT/UPDATE flush
+    __mapper_args__ = {"eager_defaults": False}
+
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -42,6 +42,12 @@ class Customer(Base, TimestampMixing):
         back_populates="assigned_customers"
     )
 
+    user = relationship(
+        "User",
+        back_populates="customer",
+        primaryjoin="User.id==foreign(Customer.id)"
+    )
+
     def __repr__(self):
         return(
             f"<Customer(id={self.id}, phone={self.phone}, "
@@ -50,7 +50,7 @@ class User(Base, TimestampMixing):
     customer = relationship(
         "Customer",
         uselist=False,
-        backref="user",
+        back_populates="user",
         primaryjoin="User.id==foreign(Customer.id)"
     )
     
@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from ...models import User
+from sqlalchemy.engine import Row
+from ...models import User, UserRole
 from ...schemas import UserCreate, UserResponse
 from ...schemas.admin_manager import AdminManagerCreate
 
@@ -29,10 +30,22 @@ class IUserRepository(ABC):
     async def list_all(self) -> List[User]:
         pass
 
+    @abstractmethod
+    async def list_with_contacts(
+        self,
+        role: Optional[UserRole] = None,
+        admin_manager_id: Optional[str] = None
+    ) -> List[Row]:
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[User]:
         pass
 
+    @abstractmethod
+    async def email_exists(self, email: str) -> bool:
+        pass
+
     @abstractmethod
     async def find_by_phone(self, phone: str) -> Optional[User]:
         pass
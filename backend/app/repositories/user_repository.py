@@ -2,19 +2,20 @@
 
 from typing import List, Optional
 import uuid
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import exists
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 from ..models.user import User, UserRole
 from ..models.admin_manager import AdminManager
+from ..models.customer import Customer
 from ..schemas.user import UserCreate, UserUpdate
 from ..schemas.admin_manager import AdminManagerCreate
 from .interfaces.user_repository import IUserRepository
 from .async_crud import AsyncCrudRepository
 from ..utils.security import hash_password
 from ..models.admin_manager import VerificationMethod
-import logging # Temporary
-from sqlalchemy.dialects import mysql # Or postgresql, sqlite, etc.
 
 class UserRepository(
     AsyncCrudRepository[User, UserCreate, UserUpdate],
@@ -27,12 +28,18 @@ class UserRepository(
     async def find_by_email(self, email: str) -> Optional[User]:
         stmt = (
             select(User)
-            .options(selectinload(User.admin_manager))
-            .where(User.admin_manager.has(email=email))
+            .join(User.admin_manager)
+            .options(contains_eager(User.admin_manager))
+            .where(AdminManager.email == email)
         )
         result = await self.session.execute(stmt)
         return result.scalars().first()
     
+    async def email_exists(self, email: str) -> bool:
+        stmt = select(exists().where(AdminManager.email == email))
+        result = await self.session.execute(stmt)
+        return bool(result.scalar())
+
     async def find_by_phone(self, phone: str) -> Optional[User]:
         stmt = (
             select(User)
@@ -87,6 +94,41 @@ class UserRepository(
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def list_with_contacts(
+        self,
+        role: Optional[UserRole] = None,
+        admin_manager_id: Optional[str] = None
+    ) -> List[Row]:
+        """
+        List users with their contact email/phone as plain rows, without hydrating ORM objects.
+
+        Args:
+            role: Only return users with this role
+            admin_manager_id: Only return users whose admin_manager record has this ID
+
+        Returns:
+            List[Row]: Rows with id, role, is_active, created_at, updated_at, email and phone
+        """
+        stmt = (
+            select(
+                User.id,
+                User.role,
+                User.is_active,
+                User.created_at,
+                User.updated_at,
+                AdminManager.email,
+                Customer.phone
+            )
+            .outerjoin(AdminManager, AdminManager.id == User.id)
+            .outerjoin(Customer, Customer.id == User.id)
+        )
+        if role is not None:
+            stmt = stmt.where(User.role == role)
+        if admin_manager_id is not None:
+            stmt = stmt.where(AdminManager.id == admin_manager_id)
+        result = await self.session.execute(stmt)
+        return result.all()
+
     async def get_by_id(self, id: uuid.UUID) -> Optional[User]:
         stmt = (
             select(self.model)
@@ -96,16 +138,8 @@ class UserRepository(
             )
             .where(self.model.id == str(id))
         )
-        
-        # For logging the compiled query with literal binds
-        compiled_stmt_str = str(stmt.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
-        logging.warning(f"UserRepository.get_by_id: Attempting to find user with ID_str: {str(id)}")
-        logging.warning(f"UserRepository.get_by_id: Compiled SQL: {compiled_stmt_str}")
-
         result = await self.session.execute(stmt)
-        user = result.scalars().first()
-        logging.warning(f"UserRepository.get_by_id: User found from DB: {user}")
-        return user
+        return result.scalars().first()
 
     async def update(self, id: uuid.UUID, data: UserUpdate) -> Optional[User]:
         user_to_update = await self.get_by_id(id)
@@ -5,16 +5,20 @@ from typing import List
 from uuid import UUID
 from ..models.user import User, UserRole
 from ..schemas.user import UserCreate, UserUpdate, UserResponse
-from ..repositories.interfaces.user_repository import IUserRepository
 from .crud_service import CRUDService
-import logging # Temporary import for debugging
+
+def _manages_customer(manager: User, user: User) -> bool:
+    """Whether 'user' is a customer assigned to 'manager' (shared by the manager permission checks)."""
+    return bool(
+        manager.role == UserRole.manager and
+        user.role == UserRole.customer and
+        user.admin_manager and
+        user.admin_manager.id == manager.id
+    )
 
 class UserService(CRUDService[User, UserCreate, UserUpdate]):
     """Contains business rules for creating, updating and deleting users."""
 
-    def __init__(self, repository: IUserRepository):
-        super().__init__(repository) 
-
     async def create_user(self, user_data: UserCreate, current_user: User) -> User:
         """
         Create a new user.
@@ -68,12 +72,7 @@ class UserService(CRUDService[User, UserCreate, UserUpdate]):
         if current_user.role == UserRole.admin:
             return await self.update(id, data)
         # Managers may update only customers assigned to them
-        if (
-            current_user.role == UserRole.manager and
-            user.role == UserRole.customer and
-            user.admin_manager and
-            user.admin_manager.id == current_user.id
-        ):
+        if _manages_customer(current_user, user):
             return await self.update(id, data)
         # All other roles cannot update any user
         raise HTTPException(status_code=403, detail="Not authorized to update this user")
@@ -91,12 +90,7 @@ class UserService(CRUDService[User, UserCreate, UserUpdate]):
         if current_user.role == UserRole.admin:
             return await self.delete(id)
         # Managers can delete customers assigned to them
-        if (
-            current_user.role == UserRole.manager and
-            user.role == UserRole.customer and
-            user.admin_manager and
-            user.admin_manager.id == current_user.id
-        ):
+        if _manages_customer(current_user, user):
             return await self.delete(id)
         # Otherwise, forbidden
         raise HTTPException(status_code=403, detail="Not authorized to delete this user")
@@ -114,12 +108,7 @@ class UserService(CRUDService[User, UserCreate, UserUpdate]):
         if current_user.role == UserRole.admin:
             return await self.update(id, UserUpdate(is_active=activate))
         # Managers may toggle activation only for customers assigned to them
-        if (
-            current_user.role == UserRole.manager and
-            user.role == UserRole.customer and
-            user.admin_manager and
-            user.admin_manager.id == current_user.id
-        ):
+        if _manages_customer(current_user, user):
             return await self.update(id, UserUpdate(is_active=activate))
         # All other roles cannot toggle activation
         raise HTTPException(status_code=403, detail="Not authorized to toggle activation for this user")
@@ -134,38 +123,31 @@ class UserService(CRUDService[User, UserCreate, UserUpdate]):
         """
         # Admins can see all users
         if current_user.role == UserRole.admin:
-            users = await self.list_all()
+            rows = await self.repository.list_with_contacts()
         # Managers can only see their assigned customers
         elif current_user.role == UserRole.manager:
-            users = await self.list_all()
-            users = [
-                user for user in users 
-                if user.role == UserRole.customer and 
-                user.admin_manager and 
-                user.admin_manager.id == current_user.id
-            ]
+            rows = await self.repository.list_with_contacts(
+                role=UserRole.customer,
+                admin_manager_id=current_user.id
+            )
         else:
             raise HTTPException(
                 status_code=403,
                 detail="Not authorized to list users"
             )
-        user_responses = []
-        for user in users:
-            admin_manager = user.admin_manager
-            customer = user.customer if hasattr(user, 'customer') else None
-            # For admin/manager: set email, for customer: set phone
-            email = admin_manager.email if admin_manager and admin_manager.email else None
-            phone = customer.phone if customer and customer.phone else None
-            user_responses.append(UserResponse(
-                id=user.id,
-                role=user.role,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-                email=email,
-                phone=phone
-            ))
-        return user_responses
+        # For admin/manager the row carries email, for customer it carries phone
+        return [
+            UserResponse(
+                id=row.id,
+                role=row.role,
+                is_active=row.is_active,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                email=row.email or None,
+                phone=row.phone or None
+            )
+            for row in rows
+        ]
     
     async def list_managed_customers(self, current_user: User) -> List[User]:
         """
@@ -187,12 +169,7 @@ class UserService(CRUDService[User, UserCreate, UserUpdate]):
             )
 
         users = await self.list_all()
-        return [
-            user for user in users 
-            if user.role == UserRole.customer and 
-            user.admin_manager and 
-            user.admin_manager.id == current_user.id
-        ]
+        return [user for user in users if _manages_customer(current_user, user)]
 
     async def update_user_with_permissions(
         self,
@@ -206,10 +183,7 @@ class UserService(CRUDService[User, UserCreate, UserUpdate]):
         - Managers can update email, phone, and status of their assigned customers only.
           (Managers cannot change user roles).
         """
-        logging.warning(f"UserService: Attempting to update user with ID: {user_id_to_update}, type: {type(user_id_to_update)}") # Temporary log
-
         target_user = await self.repository.get_by_id(user_id_to_update)
-        logging.warning(f"UserService: User found by repository: {target_user}") # Temporary log
 
         if not target_user:
             raise ValueError("User to update not found")
@@ -1,8 +1,9 @@
-from .security import hash_password, verify_password, create_access_token, decode_access_token
+from .security import hash_password, verify_password, dummy_verify_password, create_access_token, decode_access_token
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "dummy_verify_password",
     "create_access_token",
     "decode_access_token"
     ]
\ No newline at end of file
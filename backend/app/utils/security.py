@@ -2,9 +2,11 @@
 
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+from functools import lru_cache
+from jose import JWTError, jwk, jwt
 from typing import Union, Optional
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,7 +17,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # JWT settings (load SECRET_KEY from environment in production)
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key")
 ALGORITHM = "HS256"
+ALGORITHMS = [ALGORITHM]
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+# HMAC key object built once instead of on every encode/decode
+SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+# Number of verified tokens whose decoded payloads are kept in memory
+DECODED_TOKEN_CACHE_SIZE = 1024
 
 
 def hash_password(password: str) -> str:
@@ -28,17 +35,33 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def dummy_verify_password() -> None:
+    """Spend the same time as verify_password when there is no account to check against."""
+    pwd_context.dummy_verify()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Generate a JWT access token."""
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
+
+
+@lru_cache(maxsize=DECODED_TOKEN_CACHE_SIZE)
+def _decode_verified_token(token: str) -> dict:
+    """Verify a token's signature and claims once; failures raise and are not cached."""
+    return jwt.decode(token, SIGNING_KEY, algorithms=ALGORITHMS)
 
 
 def decode_access_token(token: str) -> dict:
     """Decode and validate a JWT access token."""
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_verified_token(token)
     except JWTError:
-        raise ValueError("Invalid authentication credentials")
\ No newline at end of file
+        raise ValueError("Invalid authentication credentials")
+    # A cached payload may have expired since it was first verified
+    exp = payload.get("exp")
+    if exp is not None and exp < time.time():
+        raise ValueError("Invalid authentication credentials")
+    return dict(payload)
\ No newline at end of file